@@ -1,33 +1,86 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional
 
 from valueobject import ValueObject
 
+# Active ISO 4217 codes; a set lookup replaces the length/isalpha checks
+_ISO4217 = frozenset({
+    'AED', 'AFN', 'ALL', 'AMD', 'ANG', 'AOA', 'ARS', 'AUD', 'AWG', 'AZN', 'BAM', 'BBD',
+    'BDT', 'BGN', 'BHD', 'BIF', 'BMD', 'BND', 'BOB', 'BOV', 'BRL', 'BSD', 'BTN', 'BWP',
+    'BYN', 'BZD', 'CAD', 'CDF', 'CHE', 'CHF', 'CHW', 'CLF', 'CLP', 'CNY', 'COP', 'COU',
+    'CRC', 'CUC', 'CUP', 'CVE', 'CZK', 'DJF', 'DKK', 'DOP', 'DZD', 'EGP', 'ERN', 'ETB',
+    'EUR', 'FJD', 'FKP', 'GBP', 'GEL', 'GHS', 'GIP', 'GMD', 'GNF', 'GTQ', 'GYD', 'HKD',
+    'HNL', 'HTG', 'HUF', 'IDR', 'ILS', 'INR', 'IQD', 'IRR', 'ISK', 'JMD', 'JOD', 'JPY',
+    'KES', 'KGS', 'KHR', 'KMF', 'KPW', 'KRW', 'KWD', 'KYD', 'KZT', 'LAK', 'LBP', 'LKR',
+    'LRD', 'LSL', 'LYD', 'MAD', 'MDL', 'MGA', 'MKD', 'MMK', 'MNT', 'MOP', 'MRU', 'MUR',
+    'MVR', 'MWK', 'MXN', 'MXV', 'MYR', 'MZN', 'NAD', 'NGN', 'NIO', 'NOK', 'NPR', 'NZD',
+    'OMR', 'PAB', 'PEN', 'PGK', 'PHP', 'PKR', 'PLN', 'PYG', 'QAR', 'RON', 'RSD', 'RUB',
+    'RWF', 'SAR', 'SBD', 'SCR', 'SDG', 'SEK', 'SGD', 'SHP', 'SLE', 'SLL', 'SOS', 'SRD',
+    'SSP', 'STN', 'SVC', 'SYP', 'SZL', 'THB', 'TJS', 'TMT', 'TND', 'TOP', 'TRY', 'TTD',
+    'TWD', 'TZS', 'UAH', 'UGX', 'USD', 'USN', 'UYI', 'UYU', 'UYW', 'UZS', 'VED', 'VES',
+    'VND', 'VUV', 'WST', 'XAF', 'XAG', 'XAU', 'XBA', 'XBB', 'XBC', 'XBD', 'XCD', 'XCG',
+    'XDR', 'XOF', 'XPD', 'XPF', 'XPT', 'XSU', 'XTS', 'XUA', 'XXX', 'YER', 'ZAR', 'ZMW',
+    'ZWG', 'ZWL',
+})
 
-@dataclass(frozen=True)
+
+# One shared instance per currency code (flyweight); only valid codes get in
+_POOL: dict[str, 'CurrencyCode'] = {}
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class CurrencyCode:
-    """Currency code value object"""
+    """Currency code value object, interned so each code exists only once"""
     code: str
 
-    def __post_init__(self):
-        if len(self.code) != 3 or not self.code.isalpha():
-            raise ValueError("Currency code must be 3 letters")
+    def __new__(cls, code):
+        # Check the type first: an unhashable code would make the dict/set
+        # lookups raise TypeError instead of the documented ValueError
+        obj = _POOL.get(code) if isinstance(code, str) else None
+        if obj is not None:
+            return obj
+        if not isinstance(code, str) or code not in _ISO4217:
+            raise ValueError("Currency code must be a 3-letter ISO 4217 code")
+        obj = object.__new__(cls)
+        object.__setattr__(obj, 'code', code)
+        _POOL[code] = obj
+        return obj
+
+    def __reduce__(self):
+        # Unpickling and copying go back through __new__ and get the pooled instance
+        return self.__class__, (self.code,)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Money(ValueObject):
     amount: Decimal
     currency: CurrencyCode
-    exchange_rate: Optional[Decimal] = None
 
     def __post_init__(self):
         if self.amount < 0:
             raise ValueError("Amount cannot be negative")
-        if self.exchange_rate is not None and self.exchange_rate <= 0:
+
+
+@dataclass(frozen=True, slots=True)
+class MoneyWithFX(Money):
+    """Money with an exchange rate; plain Money skips the rate check entirely"""
+    exchange_rate: Decimal
+
+    def __post_init__(self):
+        # Not super(): slots=True re-creates the class and breaks its zero-argument form
+        Money.__post_init__(self)
+        if self.exchange_rate <= 0:
             raise ValueError("Exchange rate must be positive")
 
 
+def money(amount, currency, exchange_rate=None):
+    """Build Money, or MoneyWithFX when an exchange rate is given"""
+    if exchange_rate is not None:
+        return MoneyWithFX(amount, currency, exchange_rate)
+    return Money(amount, currency)
+
+
 # Usage
-money = Money(Decimal('99.99'), CurrencyCode('USD'), Decimal('1.25'))
-print(repr(money))  # Money(amount=Decimal('99.99'), currency=CurrencyCode(code='USD'), exchange_rate=Decimal('1.25'))
\ No newline at end of file
+price = money(Decimal('99.99'), CurrencyCode('USD'), Decimal('1.25'))
+print(repr(price))  # MoneyWithFX(amount=Decimal('99.99'), currency=CurrencyCode(code='USD'), exchange_rate=Decimal('1.25'))
+print(repr(money(Decimal('5'), CurrencyCode('EUR'))))  # Money(amount=Decimal('5'), currency=CurrencyCode(code='EUR'))
\ No newline at end of file
@@ -3,7 +3,7 @@ from typing import Optional
 
 from valueobject import ValueObject
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeographicCoordinate(ValueObject):
     latitude: float
     longitude: float
@@ -18,7 +18,8 @@ class GeographicCoordinate(ValueObject):
             raise ValueError("Altitude cannot be negative")
 
 
-# Usage
-coord = GeographicCoordinate(40.7128, -74.0060, 10.5)
-print(repr(coord))  # GeographicCoordinate(latitude=40.7128, longitude=-74.006, altitude=
-print(coord)
\ No newline at end of file
+if __name__ == "__main__":
+    # Usage
+    coord = GeographicCoordinate(40.7128, -74.0060, 10.5)
+    print(repr(coord))  # GeographicCoordinate(latitude=40.7128, longitude=-74.006, altitude=
+    print(coord)
@@ -0,0 +1,43 @@
+import numpy as np
+from numba import njit, prange
+
+from GeographicCoordinates import GeographicCoordinate
+
+
+@njit(parallel=True, cache=True)
+def validate_coords_bulk(lat: np.ndarray, lon: np.ndarray, alt: np.ndarray) -> np.ndarray:
+    """
+    Validate many coordinates at once, with the same rules as
+    GeographicCoordinate.__post_init__.
+    Takes float64 arrays of equal length (NaN altitude means "no altitude")
+    and returns a boolean mask of the valid rows; raises ValueError if the
+    lengths differ.
+    """
+    n = lat.shape[0]
+    # Numba doesn't bounds-check, so shorter lon/alt arrays would be read past their end
+    if lon.shape[0] != n or alt.shape[0] != n:
+        raise ValueError("lat, lon and alt must have the same length")
+    mask = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        mask[i] = (-90.0 <= lat[i] <= 90.0
+                   and -180.0 <= lon[i] <= 180.0
+                   and (np.isnan(alt[i]) or alt[i] >= 0.0))
+    return mask
+
+
+if __name__ == "__main__":
+    # Usage: check a whole GPS trace first, then build objects only for valid rows
+    lat = np.array([40.7128, 91.0, 51.5074, -33.8688])
+    lon = np.array([-74.0060, 0.0, -0.1278, 151.2093])
+    alt = np.array([10.5, 0.0, np.nan, -5.0])
+
+    mask = validate_coords_bulk(lat, lon, alt)
+    print(mask)  # [ True False  True False]
+
+    # Rows are already validated, so skip the per-object __post_init__ checks
+    coords = [
+        GeographicCoordinate._unchecked(latitude=la, longitude=lo,
+                                        altitude=None if np.isnan(al) else al)
+        for la, lo, al in zip(lat[mask].tolist(), lon[mask].tolist(), alt[mask].tolist())
+    ]
+    print(coords)
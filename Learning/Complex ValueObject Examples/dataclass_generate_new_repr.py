@@ -3,15 +3,12 @@ from decimal import Decimal
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValueObject:
-    print(f'Value Object is called')
-
     def __repr__(self):
-        print('ValueObject.__repr__ is called')
         return "ValueObject repr"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CurrencyCode:
     """Currency code value object"""
     code: str
@@ -21,7 +18,7 @@ class CurrencyCode:
         if len(self.code) != 3 or not self.code.isalpha():
             raise ValueError("Currency code must be 3 letters")
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Money(ValueObject):
     amount: Decimal
     currency: CurrencyCode
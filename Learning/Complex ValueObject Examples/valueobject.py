@@ -1,43 +1,128 @@
+import dataclasses
 from dataclasses import dataclass
 
+
+def _create_repr_fn(cls):
+    """
+    Compile a repr builder for a dataclass as a single f-string,
+    the way dataclasses generates its own methods (no fields()/getattr loop)
+    """
+    args = ", ".join(f"{f.name}={{self.{f.name}!r}}"
+                     for f in dataclasses.fields(cls) if f.repr)
+    ns = {}
+    exec(f"def _build_repr(self):\n  return f'{cls.__name__}({args})'\n", {}, ns)
+    return ns['_build_repr']
+
+
 @dataclass(frozen=True)
 class ValueObject:
-    print(f'Value Object is called')
+    # Declared by hand instead of slots=True so there is room for the repr cache;
+    # subclasses use @dataclass(frozen=True, slots=True) for their own fields
+    __slots__ = ('_repr',)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # @dataclass only generates __repr__ when the class doesn't define one,
+        # so putting ours on the subclass keeps the cached version below in use.
+        # Only do it while nothing between cls and ValueObject overrides __repr__,
+        # otherwise a parent's custom __repr__ would be hidden from its children
+        for klass in cls.__mro__:
+            if '__repr__' in klass.__dict__:
+                if klass.__dict__['__repr__'] is ValueObject.__repr__:
+                    cls.__repr__ = ValueObject.__repr__
+                break
+
+    @classmethod
+    def _unchecked(cls, **fields):
+        """
+        Internal: build an instance from already-validated values (DB rows,
+        deserialization) without running __init__ or __post_init__.
+        All fields must be passed; nothing is checked or defaulted.
+        """
+        obj = object.__new__(cls)
+        for name, value in fields.items():
+            object.__setattr__(obj, name, value)
+        return obj
+
+    def __getstate__(self):
+        """
+        Pickle/copy state without the cached _repr: restoring it would go
+        through the frozen __setattr__ and fail, and it is rebuilt on demand
+        """
+        state = object.__getstate__(self)
+        if isinstance(state, tuple):
+            state, slots = state
+            slots = {name: value for name, value in slots.items() if name != '_repr'}
+            if slots:
+                return state, slots
+        return state
+
     def __eq__(self, other):
-        print('eq is called')
         if not isinstance(other, self.__class__):
             return False
         return self.value == other.value
 
     def __hash__(self):
-        print('hash is called')
         return hash(self.value)
 
     def __repr__(self):
-        print('repr is called')
         """
         Universal __repr__ that works for most ValueObjects
         Can be overridden for special cases
+
+        The instance is frozen, so the string is built once and cached in _repr.
+        A field holding a mutable value (e.g. a list) that is changed in place
+        after the first repr() is not reflected: the cached string goes stale.
         """
-        import dataclasses
-
-        if dataclasses.is_dataclass(self):
-            field_values = []
-            for field in dataclasses.fields(self):
-                value = getattr(self, field.name)
-                field_values.append(f"{field.name}={value!r}")
-            args = ', '.join(field_values)
-            print('dataclass : ' + args)
+        try:
+            return self._repr
+        except AttributeError:
+            pass
+
+        cls = self.__class__
+        # Check the class itself: a plain subclass inherits __dataclass_fields__
+        # from ValueObject, which would make is_dataclass() true for it too
+        if '__dataclass_fields__' in cls.__dict__:
+            # Compiled on the first repr of each class; @dataclass hasn't set up
+            # the fields yet when __init_subclass__ runs
+            build_repr = cls.__dict__.get('_build_repr')
+            if build_repr is None:
+                build_repr = _create_repr_fn(cls)
+                cls._build_repr = build_repr
+            text = build_repr(self)
         else:
-            # Fallback for non-dataclass objects
+            # Fallback for non-dataclass objects: read only the instance state
+            # (__slots__ and __dict__) instead of everything dir() walks the MRO for
             attrs = []
-            for attr_name in dir(self):
-                if not attr_name.startswith('_') and hasattr(self, attr_name):
-                    attr_value = getattr(self, attr_name)
-                    if not callable(attr_value):
-                        attrs.append(f"{attr_name}={attr_value!r}")
-            args = ', '.join(attrs)
-            print('dataclass : ' + args)
+            for klass in reversed(cls.__mro__):
+                slots = klass.__dict__.get('__slots__', ())
+                if isinstance(slots, str):  # __slots__ = 'value' names one slot
+                    slots = (slots,)
+                for attr_name in slots:
+                    if not attr_name.startswith('_') and hasattr(self, attr_name):
+                        attrs.append(f"{attr_name}={getattr(self, attr_name)!r}")
+            for attr_name, attr_value in getattr(self, '__dict__', {}).items():
+                if not attr_name.startswith('_'):
+                    attrs.append(f"{attr_name}={attr_value!r}")
+            text = f"{cls.__name__}({', '.join(attrs)})"
+
+        # Frozen dataclasses block normal assignment, so bypass __setattr__
+        object.__setattr__(self, '_repr', text)
+        return text
+
+
+if __name__ == "__main__":
+    @dataclass(frozen=True)
+    class Point(ValueObject):
+        x: int
+        y: int
+
+    class Label(ValueObject):
+        def __repr__(self):
+            return "custom Label repr"
 
-        return f"{self.__class__.__name__}({args})"
+    class SubLabel(Label):
+        pass
 
+    print(repr(Point(1, 2)))  # Point(x=1, y=2) - cached ValueObject repr
+    print(repr(SubLabel()))   # custom Label repr - the override is inherited
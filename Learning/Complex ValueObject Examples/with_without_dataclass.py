@@ -2,7 +2,6 @@ from dataclasses import dataclass
 
 @dataclass(frozen=True)
 class ValueObject:
-    print('Value Object is called')
     def __repr__(self):
         return "ValueObject's custom repr"
 
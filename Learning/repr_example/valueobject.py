@@ -1,41 +1,117 @@
+import dataclasses
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+def _create_fn(cls, name, args, body):
+    """Compile a method for cls from source, like dataclasses._create_fn"""
+    src = f"def {name}({', '.join(args)}):\n" + "\n".join(f"  {line}" for line in body)
+    ns = {}
+    exec(src, {}, ns)
+    fn = ns[name]
+    fn.__qualname__ = f"{cls.__qualname__}.{name}"
+    return fn
+
+
+def _is_generated(fn):
+    """True for the placeholder/compiled methods ValueObject installs itself"""
+    return getattr(fn, '_value_object_generated', False)
+
+
+def _inherits_default(cls, name):
+    """
+    True when the nearest `name` in the MRO is object's or one of ours,
+    i.e. nothing between cls and ValueObject defines its own version
+    """
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass is object or _is_generated(klass.__dict__[name])
+    return True
+
+
+def _compile_eq_hash(cls):
+    """
+    Replace the placeholders on cls with compiled __eq__/__hash__, following
+    the dataclass field rules: only compare=True fields are compared, hash
+    uses f.hash (or f.compare when hash is None), ClassVar/InitVar are never
+    fields. Plain subclasses and @dataclass(eq=False) get no generated methods
+    and fall back to whatever they inherit (identity for a bare ValueObject).
+    """
+    names = [name for name in ('__eq__', '__hash__') if _is_generated(cls.__dict__.get(name))]
+    params = cls.__dict__.get('__dataclass_params__')
+    if params is None or not params.eq:
+        for name in names:
+            delattr(cls, name)
+        return
+
+    fields = dataclasses.fields(cls)
+    compared = [f.name for f in fields if f.compare]
+    hashed = [f.name for f in fields if (f.compare if f.hash is None else f.hash)]
+    values = "(" + "".join(f"self.{name}," for name in compared) + ")"
+    others = "(" + "".join(f"other.{name}," for name in compared) + ")"
+    methods = {
+        '__eq__': _create_fn(cls, "__eq__", ("self", "other"), [
+            "if other.__class__ is not self.__class__:",
+            "  return NotImplemented",
+            f"return {values} == {others}",
+        ]),
+        '__hash__': _create_fn(cls, "__hash__", ("self",), [
+            "return hash((" + "".join(f"self.{name}," for name in hashed) + "))",
+        ]),
+    }
+    for name in names:
+        methods[name]._value_object_generated = True
+        setattr(cls, name, methods[name])
+
+
+@dataclass(frozen=True, eq=False)
 class ValueObject:
-    def __eq__(self, other):
-        print(f"Comparing: {self.__class__.__name__} vs {other.__class__.__name__}")
-        print(f"isinstance({other.__class__.__name__}, {self.__class__.__name__}): {isinstance(other, self.__class__)}")
-
-        if not isinstance(other, self.__class__):
-            return False
-        # For Email/Money with single value field
-        if hasattr(self, 'value'):
-            return self.value == other.value
-        # For Money with multiple fields
-        if hasattr(self, 'amount') and hasattr(self, 'currency'):
-            return self.amount == other.amount and self.currency == other.currency
-        return False
-
-    def __hash__(self):
-        if hasattr(self, 'value'):
-            return hash(self.value)
-        if hasattr(self, 'amount') and hasattr(self, 'currency'):
-            return hash((self.amount, self.currency))
-        return id(self)
-
-
-@dataclass(frozen=True)
+    # Declared by hand: slots=True re-creates the class, which breaks the
+    # zero-argument super() in __init_subclass__
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Give the subclass __eq__/__hash__ that compare its fields directly,
+        unless it (or a parent below ValueObject) defines its own.
+        @dataclass keeps methods already defined on the class, so these are used.
+        It hasn't processed the fields yet at this point, so these placeholders
+        compile the real methods from dataclasses.fields(cls) on first call.
+        """
+        super().__init_subclass__(**kwargs)
+
+        def __eq__(self, other):
+            _compile_eq_hash(cls)
+            return cls.__eq__(self, other)
+
+        def __hash__(self):
+            _compile_eq_hash(cls)
+            return cls.__hash__(self)
+
+        for placeholder in (__eq__, __hash__):
+            if _inherits_default(cls, placeholder.__name__):
+                placeholder._value_object_generated = True
+                setattr(cls, placeholder.__name__, placeholder)
+
+    @classmethod
+    def _unchecked(cls, **fields):
+        """Internal only: set fields on a bare instance, skipping __init__"""
+        obj = object.__new__(cls)
+        for name, value in fields.items():
+            object.__setattr__(obj, name, value)
+        return obj
+
+
+@dataclass(frozen=True, slots=True)
 class Email(ValueObject):
     value: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserId(ValueObject):
     value: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Money(ValueObject):
     amount: float
     currency: str
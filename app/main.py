@@ -1,7 +1,11 @@
 # MyBackend/app/main.py
-from fastapi import FastAPI
+import json
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from schemas.item import Item
+
 app = FastAPI()
 
 # Add CORS middleware
@@ -13,10 +17,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# The root response never changes, so encode it once at import time
+# (same compact form FastAPI's JSONResponse would produce)
+_ROOT_BODY = json.dumps(
+    {"message": "Hello from FastAPI! Testing 123456"},
+    ensure_ascii=False,
+    separators=(",", ":"),
+).encode("utf-8")
+
 @app.get("/")
 def read_root():
-    return {"message": "Hello from FastAPI! Testing 123456"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
+# The Item return type lets FastAPI serialize straight to JSON bytes via Pydantic
 @app.get("/items/{item_id}")
-def read_item(item_id: int, q: str = None):
-    return {"item_id": item_id, "q": q}
\ No newline at end of file
+def read_item(item_id: int, q: str = None) -> Item:
+    return Item(item_id=item_id, q=q)
@@ -24,6 +24,7 @@ Security Note:
     without proper firewall rules and security measures.
 """
 
+import functools  # For caching the detected IP address
 import socket  # For getting the local network IP address
 import subprocess  # For running the uvicorn server as a subprocess
 import sys  # For getting the Python executable path
@@ -32,6 +33,7 @@ import platform  # For detecting the operating system
 import signal  # For handling keyboard interrupts (CTRL+C)
 
 
+@functools.lru_cache(maxsize=1)
 def get_local_ip():
     """
     Get the local IP address that's actually on your network.
@@ -48,13 +50,17 @@ def get_local_ip():
     3. We extract that IP address
     4. Close the socket immediately (no actual data transfer)
 
+    The result is cached, so repeated calls don't open a new socket.
+
     Returns:
         str: Local network IP address (e.g., '192.168.1.100') or '127.0.0.1' if failed
     """
+    s = None  # Set before the try so the finally block can tell if it was created
     try:
         # Create a temporary UDP socket (no actual connection made)
+        # No timeout needed: connect() on UDP only picks a route, it never waits.
+        # (settimeout(0) made connect() raise on some systems, hiding the real IP)
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.settimeout(0)  # Don't wait for connection
 
         # Connect to Google DNS to determine which local IP would be used
         # This doesn't send any data, just determines the routing
@@ -66,8 +72,9 @@ def get_local_ip():
         # If anything fails (no internet, firewall blocks, etc.), fall back to localhost
         ip = '127.0.0.1'
     finally:
-        # Always close the socket to free resources
-        s.close()
+        # Always close the socket to free resources (if it was created)
+        if s is not None:
+            s.close()
     return ip
 
 
@@ -0,0 +1,8 @@
+# MyBackend/schemas/item.py
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    """Response schema for an item"""
+    item_id: int
+    q: str | None = None
@@ -0,0 +1,52 @@
+# tests/test_complex_valueobject.py
+import copy
+import importlib.util
+import os
+import pickle
+from dataclasses import dataclass
+
+# "Learning/Complex ValueObject Examples" isn't a package, so load valueobject.py from its path
+_path = os.path.join(os.path.dirname(__file__), "..", "Learning",
+                     "Complex ValueObject Examples", "valueobject.py")
+_spec = importlib.util.spec_from_file_location("complex_valueobject", _path)
+vo = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(vo)
+
+
+@dataclass(frozen=True)
+class Point(vo.ValueObject):
+    x: int
+    y: int
+
+
+@dataclass(frozen=True, slots=True)
+class SlottedPoint(vo.ValueObject):
+    x: int
+    y: int
+
+
+class Label(vo.ValueObject):
+    def __repr__(self):
+        return "custom Label"
+
+
+class SubLabel(Label):
+    pass
+
+
+def test_repr_is_cached():
+    point = Point(1, 2)
+    assert repr(point) == "Point(x=1, y=2)"
+    assert point._repr is repr(point)
+
+
+def test_inherited_custom_repr_is_kept():
+    assert repr(SubLabel()) == "custom Label"
+
+
+def test_pickle_and_copy_after_repr():
+    for point in (Point(1, 2), SlottedPoint(1, 2)):
+        repr(point)
+        for clone in (pickle.loads(pickle.dumps(point)), copy.copy(point), copy.deepcopy(point)):
+            assert clone == point
+            assert repr(clone) == repr(point)
@@ -0,0 +1,56 @@
+# tests/test_financial_amount.py
+import copy
+import os
+import pickle
+import sys
+from decimal import Decimal
+
+import pytest
+
+# The example imports its sibling valueobject.py, so put that folder on the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Learning",
+                                "Complex ValueObject Examples"))
+
+from FinancialAmountWithCurrency import CurrencyCode, Money, MoneyWithFX, money
+
+
+def test_currency_code_is_pooled():
+    assert CurrencyCode("USD") is CurrencyCode(code="USD")
+    assert CurrencyCode("USD") is not CurrencyCode("EUR")
+
+
+def test_pooled_instance_survives_pickle_and_copy():
+    usd = CurrencyCode("USD")
+    assert pickle.loads(pickle.dumps(usd)) is usd
+    assert copy.copy(usd) is usd
+    assert copy.deepcopy(usd) is usd
+
+
+@pytest.mark.parametrize("code", ["usd", "ABC", "US", "", 123, ["USD"]])
+def test_invalid_currency_code_raises_value_error(code):
+    with pytest.raises(ValueError):
+        CurrencyCode(code)
+
+
+def test_money_factory_without_rate_builds_money():
+    value = money(Decimal("5"), CurrencyCode("EUR"))
+    assert type(value) is Money
+    assert value == Money(Decimal("5"), CurrencyCode("EUR"))
+
+
+def test_money_factory_with_rate_builds_money_with_fx():
+    value = money(Decimal("99.99"), CurrencyCode("USD"), Decimal("1.25"))
+    assert type(value) is MoneyWithFX
+    assert isinstance(value, Money)
+    assert value.exchange_rate == Decimal("1.25")
+    assert value != Money(Decimal("99.99"), CurrencyCode("USD"))
+
+
+@pytest.mark.parametrize("args, message", [
+    ((Decimal("-1"), CurrencyCode("USD")), "Amount cannot be negative"),
+    ((Decimal("-1"), CurrencyCode("USD"), Decimal("1")), "Amount cannot be negative"),
+    ((Decimal("1"), CurrencyCode("USD"), Decimal("0")), "Exchange rate must be positive"),
+])
+def test_money_validation(args, message):
+    with pytest.raises(ValueError, match=message):
+        money(*args)
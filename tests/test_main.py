@@ -16,4 +16,9 @@ def test_read_root():
 def test_read_item():
     response = client.get("/items/42?q=test")
     assert response.status_code == 200
-    assert response.json() == {"item_id": 42, "q": "test"}
\ No newline at end of file
+    assert response.json() == {"item_id": 42, "q": "test"}
+
+def test_read_item_without_query():
+    response = client.get("/items/7")
+    assert response.status_code == 200
+    assert response.json() == {"item_id": 7, "q": None}
@@ -0,0 +1,77 @@
+# tests/test_repr_valueobject.py
+import importlib.util
+import os
+from dataclasses import InitVar, dataclass, field
+from typing import ClassVar
+
+# Learning/repr_example isn't a package, so load valueobject.py from its path
+_path = os.path.join(os.path.dirname(__file__), "..", "Learning", "repr_example", "valueobject.py")
+_spec = importlib.util.spec_from_file_location("repr_example_valueobject", _path)
+vo = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(vo)
+
+
+def test_eq_and_hash_compare_fields():
+    assert vo.Email("a@example.com") == vo.Email("a@example.com")
+    assert vo.Email("a@example.com") != vo.Email("b@example.com")
+    assert hash(vo.Money(1.0, "USD")) == hash(vo.Money(1.0, "USD"))
+    assert len({vo.Email("a"), vo.Email("a"), vo.Email("b")}) == 2
+
+
+def test_different_classes_are_not_equal():
+    assert vo.Email("123") != vo.UserId("123")
+
+
+def test_initvar_and_classvar_are_not_fields():
+    @dataclass(frozen=True)
+    class Seeded(vo.ValueObject):
+        value: int
+        seed: InitVar[int]
+        kind: ClassVar[str] = "seeded"
+
+        def __post_init__(self, seed):
+            pass
+
+    assert Seeded(1, 2) == Seeded(1, 3)
+    assert hash(Seeded(1, 2)) == hash((1,))
+
+
+def test_compare_and_hash_flags_are_honoured():
+    @dataclass(frozen=True)
+    class Tagged(vo.ValueObject):
+        value: int
+        note: str = field(compare=False)
+        extra: int = field(default=0, hash=False)
+
+    assert Tagged(1, "a") == Tagged(1, "b")
+    assert Tagged(1, "a", 1) != Tagged(1, "a", 2)
+    assert hash(Tagged(1, "a", 1)) == hash(Tagged(1, "a", 2))
+
+
+def test_own_eq_and_hash_are_kept():
+    @dataclass(frozen=True)
+    class Caseless(vo.ValueObject):
+        value: str
+
+        def __eq__(self, other):
+            return self.value.lower() == other.value.lower()
+
+        def __hash__(self):
+            return hash(self.value.lower())
+
+    assert Caseless("A") == Caseless("a")
+    assert len({Caseless("A"), Caseless("a")}) == 1
+
+
+def test_eq_false_and_plain_subclasses_use_identity():
+    @dataclass(frozen=True, eq=False)
+    class Ident(vo.ValueObject):
+        value: int
+
+    class Plain(vo.ValueObject):
+        pass
+
+    assert Ident(1) != Ident(1)
+    first, second = Plain(), Plain()
+    assert first != second
+    assert hash(first) != hash(second)